@@ -14,6 +14,21 @@ from .vector_encoding import VES
 DEFAULT_KEY_SIZE = 2048
 
 
+def _tree_sum(ys: List[EncryptedNumberJL]) -> EncryptedNumberJL:
+    """Folds ciphertexts pairwise in log2(n) levels instead of serially.
+
+    Balanced operands keep GMP in its sub-quadratic multiplication range
+    instead of repeatedly multiplying a full-size accumulator by one
+    ciphertext.
+    """
+    while len(ys) > 1:
+        paired = [ys[i] + ys[i + 1] for i in range(0, len(ys) - 1, 2)]
+        if len(ys) % 2:
+            paired.append(ys[-1])
+        ys = paired
+    return ys[0]
+
+
 class JLS(object):
     def __init__(self, nusers: int, VE: VES = None) -> None:
         """
@@ -27,6 +42,7 @@ class JLS(object):
         self.nusers: int = nusers
         self.keysize: int = None
         self.ve: VES = VE
+        self._const_encodings: Dict[Tuple[int, int], List[mpz]] = {}
 
     def setup(
         self, lmbda: int = DEFAULT_KEY_SIZE
@@ -99,6 +115,35 @@ class JLS(object):
         else:
             return sk_u.encrypt(x_u_tau, tau)
 
+    def protect_constant(
+        self, pp: PublicParamJL, sk_u: UserKeyJL, tau: int, c: int
+    ) -> List[EncryptedNumberJL]:
+        """
+        Protects a vector whose entries are all the constant c.
+
+        The vector encoding only depends on c and the encoder geometry, so it
+        is computed once and reused across steps, skipping the per-element
+        packing done by protect.
+
+        Args:
+            pp (PublicParamJL): Public parameters.
+            sk_u (UserKeyJL): User's key.
+            tau (int): Time parameter.
+            c (int): The constant value to protect.
+
+        Returns:
+            List[EncryptedNumberJL]: The protected vector.
+        """
+        assert isinstance(sk_u, UserKeyJL), "bad user key"
+        assert sk_u.pp == pp, "bad user key"
+
+        key = (c, self.ve.vectorsize)
+        encoded = self._const_encodings.get(key)
+        if encoded is None:
+            encoded = self.ve.encode([c] * self.ve.vectorsize)
+            self._const_encodings[key] = encoded
+        return sk_u.encrypt(encoded, tau)
+
     def agg(
         self,
         pp: PublicParamJL,
@@ -131,12 +176,10 @@ class JLS(object):
                     y_u_tau
                 ), "attempting to aggregate protected vectors of different sizes"
 
-            y_tau = []
-            for i in range(len(list_y_u_tau[0])):
-                y_tau_i = list_y_u_tau[0][i]
-                for y_u_tau in list_y_u_tau[1:]:
-                    y_tau_i += y_u_tau[i]
-                y_tau.append(y_tau_i)
+            y_tau = [
+                _tree_sum([y_u_tau[i] for y_u_tau in list_y_u_tau])
+                for i in range(len(list_y_u_tau[0]))
+            ]
 
             d = sk_0.decrypt(y_tau, tau, ttp=False)
             sum_x_u_tau: int = self.ve.decode(d)
@@ -144,9 +187,7 @@ class JLS(object):
         else:
             assert isinstance(list_y_u_tau[0], EncryptedNumberJL), "bad ciphertext"
 
-            y_tau = list_y_u_tau[0]
-            for y_u_tau in list_y_u_tau[1:]:
-                y_tau += y_u_tau
+            y_tau = _tree_sum(list_y_u_tau)
             sum_x_u_tau: int = sk_0.decrypt(y_tau, tau)
 
         return sum_x_u_tau
@@ -20,6 +20,10 @@ class KAS(object):
         self.sk = self.ecdh.private_key
         return self
 
+    def reset(self):
+        # regenerate the keypair in place, reusing the ECDH context
+        return self.generate()
+
     def generate_from_bytes(self, bytes):
         self.pk = self.ecdh.load_private_key_bytes(bytes)
         self.sk = self.ecdh.private_key
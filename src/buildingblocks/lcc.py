@@ -16,11 +16,22 @@ class LCC:
         super().__init__()
         self.field = get_field(bitlength)
         self.bitlength = bitlength
+        self._matrix_cache: Dict[tuple, Dict[int, dict]] = {}
 
     def _lagrange_encoding_matrix(self, alpha_s, beta_s):
         """
         Lagrange encoding matrix described in https://arxiv.org/pdf/1806.00939.pdf Equation (2)
+
+        The matrix only depends on the evaluation points, which are fixed per
+        scenario, so it is cached on first use.
         """
+        cache_key = (
+            tuple(a._value for a in alpha_s),
+            tuple(b._value for b in beta_s),
+        )
+        cached = self._matrix_cache.get(cache_key)
+        if cached is not None:
+            return cached
         num_alpha = len(alpha_s)
         num_beta = len(beta_s)
         encoding_matrix = defaultdict(dict)
@@ -48,6 +59,7 @@ class LCC:
             for j in range(num_alpha):
                 den = (alpha_s[j] - beta_s[i]) * den_s[i]
                 encoding_matrix[j][i] = num_s[j] * den.inverse()
+        self._matrix_cache[cache_key] = encoding_matrix
         return encoding_matrix
 
     def lcc_encoding_with_points(self, xs, alpha_s, beta_s):
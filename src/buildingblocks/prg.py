@@ -3,6 +3,7 @@ https://github.com/MohamadMansouri/fault-tolerant-secure-agg/tree/main
 """
 from math import ceil
 
+import numpy as np
 from Crypto.Cipher import AES
 from gmpy2 import mpz
 
@@ -17,6 +18,13 @@ class PRG(object):
         self.m = vectorsize
         self.bits = elementsize
         self.e = ceil(elementsize / 8)
+        # the all-zero plaintext fed to AES-CTR is identical for every call,
+        # so allocate it once per instance
+        self._zeros = b"".rjust(self.e * self.m, b"\x00")
+
+    def eval_vectors(self, seeds):
+        """Expands several seeds in one call, one keystream per seed."""
+        return [self.eval_vector(seed) for seed in seeds]
 
     def eval_vector(self, x):
         seed = x
@@ -33,7 +41,12 @@ class PRG(object):
         c = AES.new(
             seed[: PRG.security // 8], AES.MODE_CTR, nonce=PRG._nonce, initial_value=0
         )
-        cipher = c.encrypt(b"".rjust(self.e * self.m, b"\x00"))
+        cipher = c.encrypt(self._zeros)
+        if self.bits == 8 * self.e and self.e in (1, 2, 4, 8):
+            # whole-byte elements: reinterpret the keystream buffer in one
+            # shot; each chunk is already exactly `bits` wide so the modulo
+            # reduction is a no-op
+            return np.frombuffer(cipher, dtype=">u%d" % self.e).tolist()
         return [
             int.from_bytes(cipher[i : i + self.e], "big") % 2**self.bits
             for i in range(0, len(cipher), self.e)
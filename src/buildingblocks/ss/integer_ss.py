@@ -1,10 +1,44 @@
+from functools import lru_cache
 from math import factorial, log2
 from os import urandom as rng
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from .shamir_ss import Share
 
 
+@lru_cache(maxsize=None)
+def _lagrange_coeffs(indices: Tuple[int, ...], delta: int) -> Dict[int, int]:
+    """Computes the Lagrange coefficients for a tuple of share indices.
+
+    The coefficients depend only on the share indices and delta, so they are
+    memoized: every client recovering the same set of dropped users reuses
+    the coefficients computed by the first one.
+
+    Args:
+        indices (Tuple[int, ...]): The indices of the shares.
+        delta (int): The delta parameter used in the secret sharing.
+
+    Returns:
+        Dict[int, int]: A dictionary containing the Lagrange coefficients.
+
+    """
+    k = len(indices)
+    lag_coeffs = {}
+    for j in range(k):
+        x_j = indices[j]
+
+        numerator = 1
+        denominator = 1
+
+        for m in range(k):
+            x_m = indices[m]
+            if m != j:
+                numerator *= x_m
+                denominator *= x_m - x_j
+        lag_coeffs[x_j] = (delta * numerator) // denominator
+    return lag_coeffs
+
+
 class IShare(Share):
     """Represents an individual share in Shamir's Secret Sharing scheme.
 
@@ -192,7 +226,6 @@ class ISSS(object):
             ValueError: If duplicate shares are provided.
 
         """
-        k: int = len(shares)
         indices: List[int] = []
         for x in shares:
             idx = x.idx
@@ -200,20 +233,7 @@ class ISSS(object):
                 raise ValueError("Duplicate share")
             indices.append(idx)
 
-        lag_coeffs = {}
-        for j in range(k):
-            x_j = indices[j]
-
-            numerator = 1
-            denominator = 1
-
-            for m in range(k):
-                x_m = indices[m]
-                if m != j:
-                    numerator *= x_m
-                    denominator *= x_m - x_j
-            lag_coeffs[x_j] = (delta * numerator) // denominator
-        return lag_coeffs
+        return _lagrange_coeffs(tuple(indices), delta)
 
     def reconstruct(
         self,
@@ -146,6 +146,10 @@ class SSS(object):
         super().__init__()
         self.Field = get_field(bitlength)
         self.bitlength = bitlength
+        # every field element fits in this many bytes, which lets callers
+        # serialize shares at a fixed width
+        self.field_bytes = (self.Field(0).p.bit_length() + 7) // 8
+        self._lag_cache = {}
 
     def share(self, secret, threshold, nusers, get_coeffs=False):
         """Performs secret sharing.
@@ -166,18 +170,19 @@ class SSS(object):
             coeffs.append(field_value)
         coeffs.append(self.Field(secret))
 
-        def make_share(user, coeffs):
-            idx = self.Field(user)
-            share = self.Field(0)
-            for coeff in coeffs:
-                share = idx * share + coeff
-            return share
+        # evaluate the polynomial over raw integers and wrap each result in
+        # the field once, rather than one field object per Horner step; the
+        # evaluation points are tiny, so the intermediates only grow by a few
+        # bits per step and a single reduction per share suffices
+        p = self.Field(0).p
+        raw_coeffs = [coeff._value for coeff in coeffs]
 
         shares = []
         for i in range(1, nusers + 1):
-            share = make_share(i, coeffs)
-            share_obj = Share(i, share)
-            shares.append(share_obj)
+            value = raw_coeffs[0]
+            for coeff in raw_coeffs[1:]:
+                value = i * value + coeff
+            shares.append(Share(i, self.Field(value % p)))
         if get_coeffs:
             return shares, coeffs
         return shares
@@ -205,12 +210,77 @@ class SSS(object):
             if any(y[0] == idx for y in raw_shares):
                 raise ValueError("Duplicate share")
             raw_shares.append((idx, value))
+        # accumulate the raw products and reduce modulo p once at the end,
+        # instead of one field reduction per share
+        result = 0
+        for x_j, y_j in raw_shares:
+            result += y_j._value * lagcoefs[x_j]._value
+        return result % self.Field(0).p
+
+    def lagrange_barycentric(self, shares: List[Share]):
+        """Calculates barycentric interpolation weights for the share indices.
+
+        The weights only depend on the x-coordinates of the shares, so they
+        can be computed once and reused to reconstruct several secrets shared
+        over the same evaluation set, at O(t) multiplications each.
+
+        Args:
+            shares (List[Share]): A list of Share objects representing the shares.
+
+        Returns:
+            Tuple[dict, PField]: The per-index barycentric terms evaluated at
+            x = 0 and the inverse of their sum.
+
+        Raises:
+            ValueError: If duplicate shares are provided.
+
+        """
         k = len(shares)
-        result = self.Field(0)
+        indices: List[PField] = []
+        for x in shares:
+            idx = self.Field(x.idx)
+            if any(y == idx for y in indices):
+                raise ValueError("Duplicate share")
+            indices.append(idx)
+
+        zero = self.Field(0)
+        weights = {}
         for j in range(k):
-            x_j, y_j = raw_shares[j]
-            result += y_j * lagcoefs[x_j]
-        return result._value
+            x_j = indices[j]
+
+            denominator = zero - x_j
+            for m in range(k):
+                x_m = indices[m]
+                if m != j:
+                    denominator *= x_j - x_m
+            weights[x_j] = denominator.inverse()
+
+        denom = zero
+        for term in weights.values():
+            denom += term
+        return weights, denom.inverse()
+
+    def reconstruct_bary(self, shares: List[Share], threshold: int, weights, denom_inv):
+        """Reconstructs the secret using precomputed barycentric weights.
+
+        Args:
+            shares (List[Share]): A list of Share objects representing the shares.
+            threshold (int): The minimum number of shares required to reconstruct the secret.
+            weights: The per-index barycentric terms from lagrange_barycentric.
+            denom_inv (PField): The inverse of the sum of the terms.
+
+        Returns:
+            int: The reconstructed secret.
+
+        Raises:
+            AssertionError: If not enough shares are provided for reconstruction.
+
+        """
+        assert len(shares) >= threshold, "Not enough shares, cannot reconstruct!"
+        result = self.Field(0)
+        for x in shares:
+            result += x.value * weights[self.Field(x.idx)]
+        return (result * denom_inv)._value
 
     def lagrange(self, shares: List[Share]):
         """Calculates Lagrange coefficients for reconstructing the secret.
@@ -225,25 +295,56 @@ class SSS(object):
             ValueError: If duplicate shares are provided.
 
         """
+        # memoize per index tuple, in call order so that callers relying on
+        # the coefficients' insertion order see the same dict every time
+        cache_key = tuple(x.idx for x in shares)
+        cached = self._lag_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         k = len(shares)
-        indices: List[PField] = []
+        indices: List[int] = []
         for x in shares:
-            idx = self.Field(x.idx)
+            idx = x.idx
             if any(y == idx for y in indices):
                 raise ValueError("Duplicate share")
             indices.append(idx)
 
-        lag_coeffs = {}
-        for j in range(k):
-            x_j = indices[j]
+        # the share indices are small machine integers, so the products are
+        # taken over plain ints and lifted into the field only at the end
+        p = self.Field(0).p
 
-            numerator = self.Field(1)
-            denominator = self.Field(1)
+        # numerators: product of all indices but x_j, via prefix/suffix products
+        prefix = [1] * (k + 1)
+        for j in range(k):
+            prefix[j + 1] = prefix[j] * indices[j]
+        suffix = [1] * (k + 1)
+        for j in range(k - 1, -1, -1):
+            suffix[j] = suffix[j + 1] * indices[j]
 
+        denominators = []
+        for j in range(k):
+            x_j = indices[j]
+            denominator = 1
             for m in range(k):
-                x_m = indices[m]
                 if m != j:
-                    numerator *= x_m
-                    denominator *= x_m - x_j
-            lag_coeffs[x_j] = numerator * denominator.inverse()
+                    denominator *= indices[m] - x_j
+            denominators.append(self.Field(denominator % p))
+
+        # Montgomery batch inversion: one field inversion for all denominators
+        acc = [denominators[0]]
+        for denominator in denominators[1:]:
+            acc.append(acc[-1] * denominator)
+        inv = acc[-1].inverse()
+        inverses = [None] * k
+        for j in range(k - 1, 0, -1):
+            inverses[j] = inv * acc[j - 1]
+            inv *= denominators[j]
+        inverses[0] = inv
+
+        lag_coeffs = {}
+        for j in range(k):
+            numerator = self.Field((prefix[j] * suffix[j + 1]) % p)
+            lag_coeffs[self.Field(indices[j])] = numerator * inverses[j]
+        self._lag_cache[cache_key] = lag_coeffs
         return lag_coeffs
@@ -1,5 +1,6 @@
+from functools import lru_cache
 from os import urandom as rng
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from gmpy2 import mpz, powmod
 
@@ -9,6 +10,38 @@ from .shamir_ss import Share
 user_size: int = 16
 
 
+@lru_cache(maxsize=None)
+def _lagrange_coeffs(indices: Tuple[int, ...], delta: int) -> Dict[int, int]:
+    """Computes the Lagrange coefficients for a tuple of share indices.
+
+    The coefficients depend only on the share indices and delta, so they are
+    memoized: reconstructions over the same surviving index set across
+    rounds reuse the coefficients computed by the first one.
+
+    Args:
+        indices (Tuple[int, ...]): The indices of the shares.
+        delta (int): The delta parameter used in the secret sharing.
+
+    Returns:
+        Dict[int, int]: A dictionary containing the Lagrange coefficients.
+    """
+    k = len(indices)
+    lag_coeffs = {}
+    for j in range(k):
+        x_j = indices[j]
+
+        numerator = 1
+        denominator = 1
+
+        for m in range(k):
+            x_m = indices[m]
+            if m != j:
+                numerator *= x_m
+                denominator *= x_m - x_j
+        lag_coeffs[x_j] = (delta * numerator) // denominator
+    return lag_coeffs
+
+
 class ShoupShare(Share):
     bits: int = 0
 
@@ -138,7 +171,6 @@ class ShoupSSS(object):
         Returns:
             Dict[int, int]: A dictionary containing the Lagrange coefficients.
         """
-        k: int = len(shares)
         indices: List[int] = []
         for x in shares:
             idx = x.idx
@@ -146,17 +178,4 @@ class ShoupSSS(object):
                 raise ValueError("Duplicate share")
             indices.append(idx)
 
-        lag_coeffs = {}
-        for j in range(k):
-            x_j = indices[j]
-
-            numerator = 1
-            denominator = 1
-
-            for m in range(k):
-                x_m = indices[m]
-                if m != j:
-                    numerator *= x_m
-                    denominator *= x_m - x_j
-            lag_coeffs[x_j] = (delta * numerator) // denominator
-        return lag_coeffs
+        return _lagrange_coeffs(tuple(indices), delta)
@@ -1,60 +1,78 @@
 import random
+from functools import lru_cache
 from random import randint
 
 import gmpy2
+import numpy as np
 
 
 def add_vectors(xs, ys, mod=None):
-    zs = []
-    for a, b in zip(xs, ys):
-        z = a + b
-        if mod:
-            z = z % mod
-        zs.append(z)
-    return zs
+    # vectors cross the public API as plain lists; numpy (already a project
+    # dependency) provides the contiguous uint64 storage on the hot paths,
+    # so no array.array intermediate is needed
+    if mod is None:
+        return [a + b for a, b in zip(xs, ys)]
+    if mod & (mod - 1) == 0:
+        # power-of-two modulus: masking is cheaper than the generic modulo
+        mask = mod - 1
+        if mod <= 1 << 64:
+            # elements fit in machine words, so the whole vector can go
+            # through numpy; uint64 wraparound is exact since mod divides 2**64
+            try:
+                zs = np.asarray(xs, dtype=np.uint64) + np.asarray(ys, dtype=np.uint64)
+                return (zs & np.uint64(mask)).tolist()
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return [(a + b) & mask for a, b in zip(xs, ys)]
+    return [(a + b) % mod for a, b in zip(xs, ys)]
 
 
 def multiply_vector_by_scalar(xs, k, mod=None):
-    zs = []
-    for a in xs:
-        z = a * k
-        if mod:
-            z = z % mod
-        zs.append(z)
-    return zs
+    if mod is None:
+        return [a * k for a in xs]
+    if mod & (mod - 1) == 0:
+        mask = mod - 1
+        return [(a * k) & mask for a in xs]
+    return [(a * k) % mod for a in xs]
 
 
 def sub_vectors(xs, ys, mod=None):
-    zs = []
-    for a, b in zip(xs, ys):
-        z = a - b
-        if mod:
-            z = z % mod
-        zs.append(z)
-    return zs
-
-
-def get_field(bitlength):
+    if mod is None:
+        return [a - b for a, b in zip(xs, ys)]
+    if mod & (mod - 1) == 0:
+        mask = mod - 1
+        if mod <= 1 << 64:
+            try:
+                zs = np.asarray(xs, dtype=np.uint64) - np.asarray(ys, dtype=np.uint64)
+                return (zs & np.uint64(mask)).tolist()
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return [(a - b) & mask for a, b in zip(xs, ys)]
+    return [(a - b) % mod for a, b in zip(xs, ys)]
+
+
+@lru_cache(maxsize=None)
+def _field_for(bitlength):
     if bitlength <= 64:
-        P64Field.bits = bitlength
-        field = P64Field
+        return P64Field
     elif bitlength <= 128:
-        P128Field.bits = bitlength
-        field = P128Field
+        return P128Field
     elif bitlength <= 256:
-        P256Field.bits = bitlength
-        field = P256Field
+        return P256Field
     elif bitlength <= 512:
-        P512Field.bits = bitlength
-        field = P512Field
+        return P512Field
     elif bitlength <= 1024:
-        P1024Field.bits = bitlength
-        field = P1024Field
+        return P1024Field
     elif bitlength <= 2048:
-        P2048Field.bits = bitlength
-        field = P2048Field
-    else:
-        raise ValueError("No sufficient field for this secret size")
+        return P2048Field
+    raise ValueError("No sufficient field for this secret size")
+
+
+def get_field(bitlength):
+    field = _field_for(bitlength)
+    # the selected class is shared between nearby bitlengths, so the nominal
+    # width is (re)stamped on every call
+    field.bits = bitlength
     return field
 
 
@@ -174,10 +174,9 @@ class FlamingoClient(object):
                 + vuser.to_bytes(2, "big")
                 + gmpy2.to_binary(share_b.value._value)
             )
-            e_a = key.encrypt(message_a)
-            e_shares_a[vuser] = e_a
-            e_b = key.encrypt(message_b)
-            e_shares_b[vuser] = e_b
+            e_shares_a[vuser], e_shares_b[vuser] = key.encrypt_many(
+                [message_a, message_b]
+            )
         return self.user, e_shares_a, e_shares_b, my_commitments
 
     def setup_receive_shares_commits_sk(
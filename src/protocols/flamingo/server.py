@@ -20,6 +20,7 @@ class FlamingoServer(object):
     value_size: int = 16
     nclients: int = 10
     expanded_value_size: int = value_size + ceil(log2(nclients))
+    _mod: int = 2**expanded_value_size
     keysize: int = 256
     threshold: int = ceil(2 * nclients / 3)
 
@@ -65,6 +66,7 @@ class FlamingoServer(object):
         FlamingoServer.value_size = valuesize
         FlamingoServer.nclients = nclients
         FlamingoServer.expanded_value_size = valuesize + ceil(log2(nclients))
+        FlamingoServer._mod = 2**FlamingoServer.expanded_value_size
         FlamingoServer.keysize = keysize
         FlamingoServer.key_length = ceil(keysize / 8)
         FlamingoServer.threshold = threshold
@@ -264,7 +266,7 @@ class FlamingoServer(object):
                     continue
                 all_e_shares[vuser][user] = self.all_e_shares[user][vuser]
 
-        all_e_messages = defaultdict(dict)
+        clients_on_set = set(self.clients_on)
         self.target_pairwise = []
         for c_off in self.clients_off:
             c_off_neighbors = find_neighbors(
@@ -273,10 +275,11 @@ class FlamingoServer(object):
                 c_off,
                 FlamingoServer.neighborood_size,
             )
-            for user in c_off_neighbors:
-                if user in self.clients_on:
-                    self.target_pairwise.append((c_off, user))
-                    all_e_messages[(c_off, user)] = self.all_e_messages[(c_off, user)]
+            self.target_pairwise.extend(
+                (c_off, user) for user in c_off_neighbors & clients_on_set
+            )
+
+        all_e_messages = {k: self.all_e_messages[k] for k in self.target_pairwise}
 
         return all_e_shares, all_e_messages
 
@@ -317,7 +320,7 @@ class FlamingoServer(object):
             b_mask_vector_result = add_vectors(
                 b_mask_vector_result,
                 b_mask_vector,
-                2**FlamingoServer.expanded_value_size,
+                FlamingoServer._mod,
             )
             del b_mask_vector
             gc.collect()
@@ -341,21 +344,17 @@ class FlamingoServer(object):
             sv = FlamingoServer.prf.eval_vector(pairwise_seed)
             user, vuser = key
             if vuser > user:
-                skey = sub_vectors(skey, sv, 2**FlamingoServer.expanded_value_size)
+                skey = sub_vectors(skey, sv, FlamingoServer._mod)
             else:
-                skey = add_vectors(skey, sv, 2**FlamingoServer.expanded_value_size)
+                skey = add_vectors(skey, sv, FlamingoServer._mod)
 
         result = [0] * FlamingoServer.dimension
         for user in self.all_y:
-            result = add_vectors(
-                result, self.all_y[user], 2**FlamingoServer.expanded_value_size
-            )
+            result = add_vectors(result, self.all_y[user], FlamingoServer._mod)
 
-        result = sub_vectors(
-            result, b_mask_vector_result, 2**FlamingoServer.expanded_value_size
-        )
+        result = sub_vectors(result, b_mask_vector_result, FlamingoServer._mod)
         del b_mask_vector_result
         gc.collect()
-        result = add_vectors(result, skey, 2**FlamingoServer.expanded_value_size)
+        result = add_vectors(result, skey, FlamingoServer._mod)
 
         return result
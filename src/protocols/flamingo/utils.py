@@ -1,3 +1,4 @@
+from functools import lru_cache
 from math import ceil, log2
 
 from Crypto.Cipher import ChaCha20
@@ -6,6 +7,16 @@ from Crypto.Random import get_random_bytes
 root_seed = get_random_bytes(32)
 
 
+@lru_cache(maxsize=8)
+def _graph_params(num_clients, neighborhood_size):
+    # the graph geometry only depends on the scenario, so compute it once
+    bits_per_client = ceil(log2(num_clients))
+    num_choose = bits_per_client * neighborhood_size
+    bytes_per_client = ceil(log2(num_clients) / 8)
+    segment_len = num_choose * bytes_per_client
+    return num_choose, bytes_per_client, segment_len, bits_per_client
+
+
 def find_neighbors(current_iteration, num_clients, id, neighborhood_size):
     nonce = b"\x00\x00\x00\x00\x00\x00\x00\x00"
 
@@ -18,12 +29,10 @@ def find_neighbors(current_iteration, num_clients, id, neighborhood_size):
     # compute PRG(seed), a binary string
     prg = ChaCha20.new(key=current_seed, nonce=nonce)
 
-    # compute number of bytes we need for a graph
-    num_choose = ceil(log2(num_clients))  # number of neighbors I choose
-    num_choose = num_choose * neighborhood_size
-
-    bytes_per_client = ceil(log2(num_clients) / 8)
-    segment_len = num_choose * bytes_per_client
+    # number of neighbors I choose and the graph layout for this scenario
+    num_choose, bytes_per_client, segment_len, bits_per_client = _graph_params(
+        num_clients, neighborhood_size
+    )
     num_rand_bytes = segment_len * num_clients
     data = b"a" * num_rand_bytes
     graph_string = prg.encrypt(data)
@@ -32,9 +41,6 @@ def find_neighbors(current_iteration, num_clients, id, neighborhood_size):
     my_segment = graph_string[
         (id - 1) * segment_len : (id - 1) * (segment_len) + segment_len
     ]
-
-    # define the number of bits within bytes_per_client that can be convert to int (neighbor's ID)
-    bits_per_client = ceil(log2(num_clients))
     # default number of clients is power of two
     for i in range(num_choose):
         tmp = my_segment[i * bytes_per_client : i * bytes_per_client + bytes_per_client]
@@ -20,6 +20,7 @@ class ClientFTSA:
     threshold: int = ceil(2 * nclients / 3)
     clients: list = [i + 1 for i in range(nclients)]
     ve: VES = VES(key_size // 2, nclients, value_size, dimension)
+    _mod: int = 2**ve.elementsize
     tjl: TJLS = TJLS(threshold, nclients, ve)
     pp, _, _ = tjl.setup(key_size)
     prg: PRG = PRG(dimension, value_size)
@@ -72,6 +73,7 @@ class ClientFTSA:
         ClientFTSA.threshold = threshold
         ClientFTSA.clients = [i + 1 for i in range(nclients)]
         ClientFTSA.ve = VES(keysize // 2, nclients, valuesize, dimension)
+        ClientFTSA._mod = 2**ClientFTSA.ve.elementsize
         ClientFTSA.tjl = TJLS(threshold, nclients, ClientFTSA.ve)
         ClientFTSA.tjl.setup(keysize)
         ClientFTSA.pp = publicparam
@@ -170,7 +172,7 @@ class ClientFTSA:
         """
         b_mask = randint(0, 2**PRG.security - 1)
         b_mask_vector = ClientFTSA.prg.eval_vector(b_mask)
-        x_masked = add_vectors(self.x, b_mask_vector, 2 ** (ClientFTSA.ve.elementsize))
+        x_masked = add_vectors(self.x, b_mask_vector, ClientFTSA._mod)
         y = ClientFTSA.tjl.protect(ClientFTSA.pp, self.key, self.step, x_masked)
         shares = ClientFTSA.ss.share(b_mask, self.threshold, self.nclients)
         e_messages = {}
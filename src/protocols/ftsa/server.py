@@ -2,12 +2,33 @@
 Implementation of FTSA protocol https://dl.acm.org/doi/abs/10.1145/3564625.3568135
 """
 
-from collections import defaultdict
-from math import ceil, factorial
+from math import ceil
 
 from gmpy2 import mpz
 
-from ...buildingblocks import PRG, SSS, TJLS, VES, ServerKeyJL, sub_vectors
+from ...buildingblocks import PRG, SSS, TJLS, VES, ServerKeyJL, add_vectors, sub_vectors
+
+
+class _TransposedDict:
+    """Lazy transpose of a {user: {vuser: blob}} mapping.
+
+    Exposes the same ``transposed[vuser][user]`` lookups without eagerly
+    rebuilding the O(n^2) dict of dicts; each row is materialized only when a
+    client asks for its own messages.
+    """
+
+    def __init__(self, blobs) -> None:
+        self._blobs = blobs
+
+    def __getitem__(self, vuser):
+        return {
+            user: self._blobs[user][vuser]
+            for user in self._blobs
+            if vuser in self._blobs[user]
+        }
+
+    def __len__(self) -> int:
+        return len(self._blobs)
 
 
 class ServerFTSA:
@@ -17,6 +38,7 @@ class ServerFTSA:
     key_size: int = 2048
     threshold: int = ceil(2 * nclients / 3)
     ve: VES = VES(key_size // 2, nclients, value_size, dimension)
+    _mod: int = 2**ve.elementsize
     tjl: TJLS = TJLS(threshold, nclients, ve)
     pp, _, _ = tjl.setup(key_size)
     prg: PRG = PRG(dimension, value_size)
@@ -35,6 +57,7 @@ class ServerFTSA:
         self.clients_on: list = []
         self.y: list = []
         self.delta: int = 1
+        self._lag_cache: dict = {}
 
     @staticmethod
     def set_scenario(
@@ -57,6 +80,7 @@ class ServerFTSA:
         ServerFTSA.key_size = keysize
         ServerFTSA.threshold = threshold
         ServerFTSA.ve = VES(keysize // 2, nclients, valuesize, dimension)
+        ServerFTSA._mod = 2**ServerFTSA.ve.elementsize
         ServerFTSA.tjl = TJLS(threshold, nclients, ServerFTSA.ve)
         ServerFTSA.tjl.setup(keysize)
         ServerFTSA.pp = pp
@@ -102,11 +126,8 @@ class ServerFTSA:
         """
         assert len(all_e_messages) >= ServerFTSA.threshold
 
-        e_messages = defaultdict(dict)
-        for user in all_e_messages:
-            self.clients.append(user)
-            for vuser in all_e_messages[user]:
-                e_messages[vuser][user] = all_e_messages[user][vuser]
+        self.clients.extend(all_e_messages.keys())
+        e_messages = _TransposedDict(all_e_messages)
 
         self.delta = 1
         return e_messages
@@ -124,11 +145,8 @@ class ServerFTSA:
         """
         assert len(all_e_shares) >= ServerFTSA.threshold
 
-        e_shares = defaultdict(dict)
-        for user in all_e_shares:
-            self.clients_on.append(user)
-            for vuser in all_e_shares[user]:
-                e_shares[vuser][user] = all_e_shares[user][vuser]
+        self.clients_on.extend(all_e_shares.keys())
+        e_shares = _TransposedDict(all_e_shares)
 
         self.y = list(all_y.values())
 
@@ -147,20 +165,27 @@ class ServerFTSA:
         """
         assert len(allbshares) >= ServerFTSA.threshold
 
-        b_shares = defaultdict(list)
-        for user in allbshares:
-            for vuser in allbshares[user]:
-                b_shares[vuser].append(allbshares[user][vuser])
+        b_shares = {
+            vuser: [allbshares[user][vuser] for user in allbshares]
+            for vuser in next(iter(allbshares.values()))
+        }
 
-        lag_coeffs = []
+        bary_weights = None
         b_mask = {}
-        b_mask_vector = defaultdict(list)
+        b_mask_vector = {}
         for vuser in b_shares:
             assert len(b_shares[vuser]) >= ServerFTSA.threshold
-            if not lag_coeffs:
-                lag_coeffs = ServerFTSA.ss.lagrange(b_shares[vuser])
-            b_mask[vuser] = ServerFTSA.ss.reconstruct(
-                b_shares[vuser], ServerFTSA.threshold, lag_coeffs
+            if bary_weights is None:
+                # the weights only depend on the set of online clients,
+                # which is the same for every vuser and across fl steps
+                cache_key = frozenset(share.idx for share in b_shares[vuser])
+                cached = self._lag_cache.get(cache_key)
+                if cached is None:
+                    cached = ServerFTSA.ss.lagrange_barycentric(b_shares[vuser])
+                    self._lag_cache[cache_key] = cached
+                bary_weights, denom_inv = cached
+            b_mask[vuser] = ServerFTSA.ss.reconstruct_bary(
+                b_shares[vuser], ServerFTSA.threshold, bary_weights, denom_inv
             )
             b_mask_vector[vuser] = ServerFTSA.prg.eval_vector(b_mask[vuser])
         y_zero_shares = [y for y in y_zero_shares if y]
@@ -176,10 +201,9 @@ class ServerFTSA:
             ServerFTSA.pp, self.key, self.step, self.y, y_zero
         )
 
+        agg_mask = [0] * ServerFTSA.dimension
         for user in b_mask_vector:
-            x_masked = sub_vectors(
-                x_masked, b_mask_vector[user], 2 ** (ServerFTSA.ve.elementsize)
-            )
+            agg_mask = add_vectors(agg_mask, b_mask_vector[user])
 
-        aggregated = x_masked
+        aggregated = sub_vectors(x_masked, agg_mask, ServerFTSA._mod)
         return aggregated
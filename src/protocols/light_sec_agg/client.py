@@ -34,7 +34,7 @@ class LightSecAggClient:
         super().__init__()
         self.user: int = user
         self.step: int = 0
-        self.ckeys: Dict[int, gmpy2.mpz] = {}
+        self.ckeys: Dict[int, AESKEY] = {}
         self.u: List[int] = []
         self.clients_on: List[int] = []
         self.key_shares: Dict[int, List[gmpy2.mpz]] = {}
@@ -69,6 +69,9 @@ class LightSecAggClient:
         LightSecAggClient.clients = [i + 1 for i in range(nclients)]
         LightSecAggClient.lcc = LCC(keysize)
         LightSecAggClient.field = get_field(keysize)
+        LightSecAggClient.share_bytes = (
+            LightSecAggClient.field(0).p.bit_length() + 7
+        ) // 8
 
     def new_fl_step(self) -> None:
         """
@@ -110,7 +113,9 @@ class LightSecAggClient:
         for vuser in alldhpks:
             if vuser == self.user:
                 continue
-            self.ckeys[vuser] = self.ka_c.agree(alldhpks[vuser])
+            # wrap the agreed secret once; the AES key schedule is reused
+            # for every message exchanged with this peer
+            self.ckeys[vuser] = AESKEY(self.ka_c.agree(alldhpks[vuser]))
 
     def share_local_mask(self) -> Tuple[int, Dict[int, bytes]]:
         """
@@ -135,14 +140,11 @@ class LightSecAggClient:
             if vuser == self.user:
                 self.mask_shares[vuser] = shares
                 continue
-            key = AESKEY(self.ckeys[vuser])
-            binaries_shares = []
-            for share in shares:
-                share = gmpy2.to_binary(share._value)
-                sharelen = len(share)
-                binaries_shares.append(sharelen.to_bytes(2, "big"))
-                binaries_shares.append(share)
-            binaries_shares = b"".join(binaries_shares)
+            key = self.ckeys[vuser]
+            share_bytes = LightSecAggClient.share_bytes
+            binaries_shares = b"".join(
+                int(share._value).to_bytes(share_bytes, "big") for share in shares
+            )
             message = (
                 self.user.to_bytes(2, "big")
                 + vuser.to_bytes(2, "big")
@@ -165,20 +167,18 @@ class LightSecAggClient:
         for vuser in e_shares.keys():
             if vuser == self.user:
                 continue
-            key = AESKEY(self.ckeys[vuser])
+            key = self.ckeys[vuser]
             message = key.decrypt(e_shares[vuser])
             u = int.from_bytes(message[:2], byteorder="big")
             v = int.from_bytes(message[2:4], byteorder="big")
             assert v == self.user and u == vuser, "invalid encrypted message"
-            i = 4
-            decrypted_shares = []
-            while i < len(message):
-                share_len = int.from_bytes(message[i : i + 2], byteorder="big")
-                share = message[i + 2 : i + 2 + share_len]
-                decrypted_share = LightSecAggClient.field(gmpy2.from_binary(share))
-                decrypted_shares.append(decrypted_share)
-                i = i + 2 + share_len
-            self.mask_shares[vuser] = decrypted_shares
+            share_bytes = LightSecAggClient.share_bytes
+            self.mask_shares[vuser] = [
+                LightSecAggClient.field(
+                    int.from_bytes(message[i : i + share_bytes], byteorder="big")
+                )
+                for i in range(4, len(message), share_bytes)
+            ]
 
     def online_encrypt(self) -> Tuple[int, List[gmpy2.mpz]]:
         """
@@ -200,12 +200,12 @@ class LightSecAggClient:
         Returns:
             Tuple[int, List[gmpy2.mpz]]: A tuple containing the user ID and recovered data.
         """
-        d_encoded = ceil(
-            LightSecAggClient.dimension
-            / (LightSecAggClient.nclients_target_on - LightSecAggClient.threshold)
-        )
-        sum_encoded_mask: List[gmpy2.mpz] = [LightSecAggClient.field(0)] * d_encoded
-        for vuser in clients_on:
-            for k in range(d_encoded):
-                sum_encoded_mask[k] += self.mask_shares[vuser][k]
+        # accumulate the raw values column-wise and reduce modulo p once per
+        # element, instead of one field operation per share
+        field = LightSecAggClient.field
+        p = field(0).p
+        rows = [self.mask_shares[vuser] for vuser in clients_on]
+        sum_encoded_mask = [
+            field(sum(share._value for share in column) % p) for column in zip(*rows)
+        ]
         return self.user, sum_encoded_mask
@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
 
-from ...buildingblocks import LCC, add_vectors, get_field, sub_vectors
+from ...buildingblocks import LCC, get_field, sub_vectors
 from ...buildingblocks.key_agreement import KAS
 
 
@@ -35,6 +35,8 @@ class LightSecAggServer:
         self.x: List[Any] = []
         self.ka_channel: KAS = KAS()
         self.y: List[Any] = []
+        self._alpha_cache: List[Any] = []
+        self._beta_cache: List[Any] = []
 
     @staticmethod
     def set_scenario(
@@ -93,10 +95,14 @@ class LightSecAggServer:
         Returns:
             Dict[Any, Dict[Any, Any]]: A dictionary of distributed local masks.
         """
-        eshares: Dict[Any, Dict[Any, Any]] = defaultdict(dict)
-        for u in alleshares.keys():
-            for v in alleshares[u].keys():
-                eshares[v][u] = alleshares[u][v]
+        eshares: Dict[Any, Dict[Any, Any]] = {
+            v: {
+                u: alleshares[u][v]
+                for u in alleshares
+                if v in alleshares[u]
+            }
+            for v in alleshares
+        }
         return eshares
 
     def online_encrypt(self, all_y: Dict[Any, Any]) -> List[Any]:
@@ -110,10 +116,13 @@ class LightSecAggServer:
             List[Any]: A list of clients who participated in encryption.
         """
         self.clients_on = list(all_y.keys())
-        aggregated: List[Any] = [self.field(0)] * LightSecAggServer.dimension
-        for y in all_y.values():
-            aggregated = add_vectors(aggregated, y)
-        self.y = aggregated
+        # sum raw values column-wise and reduce modulo p once per element,
+        # instead of one field operation per client and element
+        field = LightSecAggServer.field
+        p = field(0).p
+        self.y = [
+            field(sum(y._value for y in column) % p) for column in zip(*all_y.values())
+        ]
         return self.clients_on
 
     def aggregate(self, all_sum_encoded_mask: Dict[Any, Any]) -> List[Any]:
@@ -129,21 +138,22 @@ class LightSecAggServer:
         field = LightSecAggServer.field
         nclients = LightSecAggServer.nclients
         dimension = LightSecAggServer.dimension
-        d_encoded = LightSecAggServer.d_encoded
         nclients_on = len(self.clients_on)
 
-        alpha_s: List[Any] = [field(i + 1) for i in range(nclients_on)]
-        beta_s: List[Any] = [field(i + (nclients + 1)) for i in range(nclients_on)]
+        # the evaluation points depend only on how many clients stayed
+        # online, so grow the cached lists once and slice
+        while len(self._alpha_cache) < nclients_on:
+            i = len(self._alpha_cache)
+            self._alpha_cache.append(field(i + 1))
+            self._beta_cache.append(field(i + (nclients + 1)))
+        alpha_s: List[Any] = self._alpha_cache[:nclients_on]
+        beta_s: List[Any] = self._beta_cache[:nclients_on]
         all_sum_encoded_mask = [
             list(all_sum_encoded_mask[key]) for key in all_sum_encoded_mask.keys()
         ]
-        all_sum_encoded_mask[: LightSecAggServer.nclients_target_on]
         decoded_mask = LightSecAggServer.lcc.decoding_with_points(
             all_sum_encoded_mask, alpha_s, beta_s
         )
-        aggregate_mask = np.reshape(
-            decoded_mask, (nclients_on * d_encoded, 1)
-        ).flatten()
-        aggregate_mask = aggregate_mask[:dimension].tolist()
+        aggregate_mask = np.asarray(decoded_mask).ravel()[:dimension].tolist()
         aggregated = sub_vectors(self.y, aggregate_mask)
         return aggregated
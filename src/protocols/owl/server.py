@@ -1,4 +1,3 @@
-from collections import defaultdict
 from math import ceil
 
 from gmpy2 import mpz
@@ -114,11 +113,17 @@ class OwlServer(object):
             dict: Encrypted key shares for clients.
         """
         assert len(all_e_shares) >= OwlServer.threshold
-        ekshares = defaultdict(dict)
-        for user in all_e_shares:
-            self.clients.append(user)
-            for vuser in all_e_shares[user]:
-                ekshares[vuser][user] = all_e_shares[user][vuser]
+        self.clients.extend(all_e_shares.keys())
+        # transpose user -> vuser to vuser -> user in one comprehension
+        vusers = set().union(*map(dict.keys, all_e_shares.values()))
+        ekshares = {
+            vuser: {
+                user: all_e_shares[user][vuser]
+                for user in all_e_shares
+                if vuser in all_e_shares[user]
+            }
+            for vuser in vusers
+        }
         return ekshares
 
     def online_encrypt(self, all_y: dict) -> list:
@@ -148,10 +153,12 @@ class OwlServer(object):
         """
         sk_0_shares = list(sk_0_shares.values())
         assert len(sk_0_shares) >= OwlServer.threshold
-        lag_coeffs = OwlServer.ss.lagrange(sk_0_shares)
-        sk_0 = OwlServer.ss.reconstruct(
-            sk_0_shares, OwlServer.threshold, lag_coeffs
-        )
+        # any threshold-sized subset determines the secret, so keep the
+        # Lagrange system as small as the protocol allows
+        sk_0_shares = sk_0_shares[: OwlServer.threshold]
+        ss = OwlServer.ss
+        lag_coeffs = ss.lagrange(sk_0_shares)
+        sk_0 = ss.reconstruct(sk_0_shares, OwlServer.threshold, lag_coeffs)
         self.key = ServerKeyJL(OwlServer.pp, -sk_0)
         aggregated = OwlServer.jl.agg(OwlServer.pp, self.key, 0, self.y)
         return aggregated
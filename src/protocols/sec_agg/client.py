@@ -2,16 +2,16 @@
 Implementation of the SecAgg protocol. (Reference: https://eprint.iacr.org/2017/281.pdf)
 """
 
-import gc
+import struct
 from math import ceil, log2
 from random import randint
 from typing import Dict, List, Tuple
 
-import gmpy2
+import numpy as np
 
 from ...buildingblocks import KAS, PRG, SSS
 from ...buildingblocks import EncryptionKey as AESKEY
-from ...buildingblocks import Share, add_vectors, sub_vectors
+from ...buildingblocks import Share
 
 
 class SecAggClient(object):
@@ -19,6 +19,7 @@ class SecAggClient(object):
     value_size: int = 16
     nclients: int = 10
     expanded_value_size: int = value_size + ceil(log2(nclients))
+    _mask: int = 2**expanded_value_size - 1
     keysize: int = 256
     threshold: int = ceil(2 * nclients / 3)
     clients: List[int] = [i + 1 for i in range(nclients)]
@@ -36,13 +37,13 @@ class SecAggClient(object):
         super().__init__()
         self.user = user
         self.step = 1
-        self.all_dh_pkc: Dict[int, bytes] = {}
+        self.all_dh_pkc: Dict[int, AESKEY] = {}
         self.clients: List[int] = []
         self.clients_on: List[int] = []
         self.b_shares: Dict[int, Share] = {}
         self.sk_shares: Dict[int, Share] = {}
-        self.ka_sk: KAS = KAS()
-        self.ka_channel: KAS = KAS()
+        self.ka_sk: KAS = KAS().generate()
+        self.ka_channel: KAS = KAS().generate()
         self.b_mask: int = 0
         self.all_dh_pks: Dict[int, bytes] = {}
 
@@ -64,6 +65,7 @@ class SecAggClient(object):
         SecAggClient.value_size = valuesize
         SecAggClient.nclients = nclients
         SecAggClient.expanded_value_size = valuesize + ceil(log2(nclients))
+        SecAggClient._mask = 2**SecAggClient.expanded_value_size - 1
         SecAggClient.keysize = keysize
         SecAggClient.threshold = threshold
         SecAggClient.clients = [i + 1 for i in range(nclients)]
@@ -78,12 +80,10 @@ class SecAggClient(object):
         self.step += 1
         self.clients = []
         self.clients_on = []
-        self.clients_on = []
         self.b_shares = {}
         self.sk_shares = {}
-        self.b_shares = {}
-        self.ka_sk = KAS()
-        self.ka_channel = KAS()
+        self.ka_sk.reset()
+        self.ka_channel.reset()
         self.all_dh_pkc = {}
         self.b_mask = 0
         self.all_dh_pks = {}
@@ -95,8 +95,6 @@ class SecAggClient(object):
         Returns:
             Tuple[int, bytes, bytes]: User identifier, secret key, and channel key.
         """
-        self.ka_sk.generate()
-        self.ka_channel.generate()
         self.clients.append(self.user)
         return self.user, self.ka_sk.pk, self.ka_channel.pk
 
@@ -120,7 +118,9 @@ class SecAggClient(object):
         for vuser in all_dh_pkc:
             if vuser == self.user:
                 continue
-            self.all_dh_pkc[vuser] = self.ka_channel.agree(all_dh_pkc[vuser])
+            # keep the ready-to-use AES key so decryption in unmasking does
+            # not re-derive a cipher context per message
+            self.all_dh_pkc[vuser] = AESKEY(self.ka_channel.agree(all_dh_pkc[vuser]))
         self.b_mask = randint(0, 2 ** (SecAggClient.prg.security) - 1)
 
         b_shares = SecAggClient.ss_b_mask.share(
@@ -141,14 +141,15 @@ class SecAggClient(object):
                 self.sk_shares[self.user] = kshare
                 self.b_shares[self.user] = bshare
                 continue
-            key = AESKEY(self.all_dh_pkc[vuser])
-            sharelen = len(gmpy2.to_binary(kshare.value._value))
+            key = self.all_dh_pkc[vuser]
             message = (
-                self.user.to_bytes(2, "big")
-                + vuser.to_bytes(2, "big")
-                + sharelen.to_bytes(2, "big")
-                + gmpy2.to_binary(kshare.value._value)
-                + gmpy2.to_binary(bshare.value._value)
+                struct.pack(">HH", self.user, vuser)
+                + int(kshare.value._value).to_bytes(
+                    SecAggClient.ss_sk.field_bytes, "big"
+                )
+                + int(bshare.value._value).to_bytes(
+                    SecAggClient.ss_b_mask.field_bytes, "big"
+                )
             )
             e = key.encrypt(message)
             e_shares[vuser] = e
@@ -171,35 +172,29 @@ class SecAggClient(object):
         """
         assert len(eshares) >= self.threshold
         self.e_shares = eshares
-        key = [0] * SecAggClient.dimension
-        for vuser in self.all_dh_pks:
-            if vuser == self.user:
-                continue
-            sv = self.ka_sk.agree(self.all_dh_pks[vuser])
-            if vuser > self.user:
-                key = sub_vectors(
-                    key,
-                    SecAggClient.prg.eval_vector(sv),
-                    2**SecAggClient.expanded_value_size,
-                )
-            else:
-                key = add_vectors(
-                    key,
-                    SecAggClient.prg.eval_vector(sv),
-                    2**SecAggClient.expanded_value_size,
-                )
-            del sv
-        b_mask_vector = SecAggClient.prg.eval_vector(self.b_mask)
-
-        x_masked = add_vectors(
-            key, b_mask_vector, 2**SecAggClient.expanded_value_size
+        # accumulate all pairwise vectors with their signs in one int64 pass;
+        # the entries are bounded by the expanded value size, so the signed
+        # sum over all peers fits comfortably in a machine word
+        mask = SecAggClient._mask
+        peers = [vuser for vuser in self.all_dh_pks if vuser != self.user]
+        key = np.zeros(SecAggClient.dimension, dtype=np.int64)
+        if peers:
+            pairwise = np.asarray(
+                [
+                    SecAggClient.prg.eval_vector(
+                        self.ka_sk.agree(self.all_dh_pks[vuser])
+                    )
+                    for vuser in peers
+                ],
+                dtype=np.int64,
+            )
+            signs = np.where(np.asarray(peers) > self.user, -1, 1)
+            key = (signs[:, None] * pairwise).sum(axis=0)
+        b_mask_vector = np.asarray(
+            SecAggClient.prg.eval_vector(self.b_mask), dtype=np.int64
         )
-        del key
-        x = [1 for _ in range(SecAggClient.dimension)]
-        y = add_vectors(x, x_masked, 2**SecAggClient.expanded_value_size)
-        del x
-        del x_masked
-        gc.collect()
+        # the input is the all-ones placeholder vector, hence the + 1
+        y = ((key + b_mask_vector + 1) & mask).tolist()
         return self.user, y
 
     def unmasking(
@@ -219,14 +214,12 @@ class SecAggClient(object):
         assert set(self.clients_on).issubset(set(self.clients))
 
         for vuser in self.e_shares:
-            key = AESKEY(self.all_dh_pkc[vuser])
-            message = key.decrypt(self.e_shares[vuser])
-            u = int.from_bytes(message[:2], "big")
-            v = int.from_bytes(message[2:4], "big")
-            sharelen = int.from_bytes(message[4:6], "big")
+            message = self.all_dh_pkc[vuser].decrypt(self.e_shares[vuser])
+            u, v = struct.unpack_from(">HH", message)
             assert v == self.user and u == vuser, "invalid encrypted message"
-            kshare = gmpy2.from_binary(message[6 : sharelen + 6])
-            bshare = gmpy2.from_binary(message[sharelen + 6 :])
+            ksize = SecAggClient.ss_sk.field_bytes
+            kshare = int.from_bytes(message[4 : 4 + ksize], "big")
+            bshare = int.from_bytes(message[4 + ksize :], "big")
             self.b_shares[vuser] = Share(
                 self.user, SecAggClient.ss_b_mask.Field(bshare)
             )
@@ -2,12 +2,13 @@
 Implementation of the SecAgg protocol. (Reference: https://eprint.iacr.org/2017/281.pdf)
 """
 
-import gc
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil, log2
-from typing import DefaultDict, Dict, List, Tuple
+from typing import Dict, List, Tuple
 
-from ...buildingblocks import KAS, PRG, SSS, add_vectors, sub_vectors
+import numpy as np
+
+from ...buildingblocks import KAS, PRG, SSS
 
 
 class SecAggServer(object):
@@ -15,6 +16,7 @@ class SecAggServer(object):
     value_size: int = 16
     nclients: int = 10
     expanded_value_size: int = value_size + ceil(log2(nclients))
+    _mask: int = 2**expanded_value_size - 1
     keysize: int = 256
     threshold: int = ceil(2 * nclients / 3)
     prg: PRG = PRG(dimension, value_size)
@@ -52,6 +54,7 @@ class SecAggServer(object):
         SecAggServer.value_size = value_size
         SecAggServer.nclients = nclients
         SecAggServer.expanded_value_size = value_size + ceil(log2(nclients))
+        SecAggServer._mask = 2**SecAggServer.expanded_value_size - 1
         SecAggServer.keysize = keysize
         SecAggServer.threshold = threshold
         SecAggServer.prg = PRG(dimension, value_size)
@@ -97,11 +100,17 @@ class SecAggServer(object):
         """
         self.clients_2 = list(all_eshares.keys())
         assert len(self.clients_2) >= SecAggServer.threshold
-        e_shares: DefaultDict[int, Dict[int, bytes]] = defaultdict(dict)
-
-        for user in all_eshares:
-            for vuser in all_eshares[user]:
-                e_shares[vuser][user] = all_eshares[user][vuser]
+        # transpose user -> vuser to vuser -> user in one comprehension;
+        # every client skips itself, so take the union of the inner keys
+        vusers = set().union(*map(dict.keys, all_eshares.values()))
+        e_shares: Dict[int, Dict[int, bytes]] = {
+            vuser: {
+                user: all_eshares[user][vuser]
+                for user in all_eshares
+                if vuser in all_eshares[user]
+            }
+            for vuser in vusers
+        }
 
         return e_shares
 
@@ -138,94 +147,70 @@ class SecAggServer(object):
         self.clients_5 = list(all_b_shares.keys())
         assert len(self.clients_5) >= SecAggServer.threshold
 
-        bshares: DefaultDict[int, List[List[int]]] = defaultdict(list)
-        for user in all_b_shares:
-            for vuser in all_b_shares[user]:
-                bshares[vuser].append(all_b_shares[user][vuser])
+        bshares: Dict[int, List[List[int]]] = {
+            vuser: [all_b_shares[user][vuser] for user in all_b_shares]
+            for vuser in next(iter(all_b_shares.values()))
+        }
 
-        lag_coeffs = []
-        b_mask_vector_result = [0] * SecAggServer.dimension
+        # one signed int64 accumulator for the whole unmasking; entries are
+        # bounded by the expanded value size, so the running sum fits a
+        # machine word and a single final mask replaces per-step reductions
+        mask = SecAggServer._mask
+        acc = np.zeros(SecAggServer.dimension, dtype=np.int64)
 
         for vuser in bshares:
             assert len(bshares[vuser]) >= SecAggServer.threshold
-            if not lag_coeffs:
-                lag_coeffs = SecAggServer.ss_b_mask.lagrange(bshares[vuser])
+            # lagrange memoizes per index tuple, so repeated calls are cheap
+            lag_coeffs = SecAggServer.ss_b_mask.lagrange(bshares[vuser])
             b_mask = SecAggServer.ss_b_mask.reconstruct(
                 bshares[vuser], SecAggServer.threshold, lag_coeffs
             )
-            b_mask_vector = SecAggServer.prg.eval_vector(b_mask)
-
-            b_mask_vector_result = add_vectors(
-                b_mask_vector_result,
-                b_mask_vector,
-                2**SecAggServer.expanded_value_size,
+            acc -= np.asarray(
+                SecAggServer.prg.eval_vector(b_mask), dtype=np.int64
             )
-            del b_mask_vector
-            gc.collect()
 
-        sk_shares: DefaultDict[int, List[List[int]]] = defaultdict(list)
-        for user in all_sk_shares:
-            for vuser in all_sk_shares[user]:
-                sk_shares[vuser].append(all_sk_shares[user][vuser])
+        sk_shares: Dict[int, List[List[int]]] = {
+            vuser: [all_sk_shares[user][vuser] for user in all_sk_shares]
+            for vuser in next(iter(all_sk_shares.values()))
+        }
 
         dh_key: Dict[int, KAS] = {}
-        lag_coeffs = []
+        sk_bytes = SecAggServer.keysize // 8
 
         for vuser in sk_shares:
             assert len(sk_shares[vuser]) >= SecAggServer.threshold
-            if not lag_coeffs:
-                lag_coeffs = SecAggServer.ss_sk.lagrange(sk_shares[vuser])
+            lag_coeffs = SecAggServer.ss_sk.lagrange(sk_shares[vuser])
             k = SecAggServer.ss_sk.reconstruct(
                 sk_shares[vuser], SecAggServer.threshold, lag_coeffs
             )
-            k = int(k)
             dh_key[vuser] = KAS().generate_from_bytes(
-                k.to_bytes(SecAggServer.keysize // 8, "big")
+                int(k).to_bytes(sk_bytes, "big")
             )
 
-        key_vector_result = [0] * SecAggServer.dimension
-        for user in self.clients:
-            if user in self.clients_3:
-                continue
-            key_vector = [0] * SecAggServer.dimension
+        def dropped_key_vector(user):
+            key_vector = np.zeros(SecAggServer.dimension, dtype=np.int64)
             for vuser in self.all_dh_pks:
                 if vuser == user:
                     continue
                 sv = dh_key[user].agree(self.all_dh_pks[vuser])
+                pairwise = np.asarray(
+                    SecAggServer.prg.eval_vector(sv), dtype=np.int64
+                )
                 if vuser > user:
-                    key_vector = sub_vectors(
-                        key_vector,
-                        SecAggServer.prg.eval_vector(sv),
-                        2**SecAggServer.expanded_value_size,
-                    )
+                    key_vector -= pairwise
                 else:
-                    key_vector = add_vectors(
-                        key_vector,
-                        SecAggServer.prg.eval_vector(sv),
-                        2**SecAggServer.expanded_value_size,
-                    )
-
-            key_vector_result = add_vectors(
-                key_vector_result, key_vector, 2**SecAggServer.expanded_value_size
-            )
-            del key_vector
-            gc.collect()
+                    key_vector += pairwise
+            return key_vector
+
+        # recovering each dropped user is independent; the AES keystream
+        # expansion releases the GIL, so threads overlap part of the work
+        dropped = [user for user in self.clients if user not in self.clients_3]
+        if dropped:
+            with ThreadPoolExecutor() as executor:
+                for key_vector in executor.map(dropped_key_vector, dropped):
+                    acc += key_vector
 
-        result = [0] * SecAggServer.dimension
         for user in self.all_y:
-            result = add_vectors(
-                result, self.all_y[user], 2**SecAggServer.expanded_value_size
-            )
+            acc += np.asarray(self.all_y[user], dtype=np.int64)
 
-        result = add_vectors(
-            result, key_vector_result, 2**SecAggServer.expanded_value_size
-        )
-        del key_vector_result
-        gc.collect()
-        result = sub_vectors(
-            result, b_mask_vector_result, 2**SecAggServer.expanded_value_size
-        )
-        del b_mask_vector_result
-        gc.collect()
-
-        return result
+        return (acc & mask).tolist()
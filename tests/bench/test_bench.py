@@ -0,0 +1,68 @@
+"""Micro-benchmarks for the cryptographic hotspots.
+
+Run with ``pytest tests/bench --benchmark-only``; the timings are the
+reference points for the optimizations in the building blocks. The module
+is skipped when pytest-benchmark is not installed.
+"""
+from functools import lru_cache
+from random import getrandbits
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from src.buildingblocks import JLS, PRG, SSS, VES
+
+pytestmark = pytest.mark.slow
+
+KEYSIZE = 2048
+NUSERS = 10
+THRESHOLD = 7
+DIMENSION = 1000
+INPUTSIZE = 16
+
+
+@lru_cache(maxsize=None)
+def _jls_setup():
+    # key generation draws two primes; share one setup across the benchmarks
+    ve = VES(KEYSIZE // 2, NUSERS, INPUTSIZE, DIMENSION)
+    jls = JLS(NUSERS, ve)
+    pp, sk_0, users = jls.setup(KEYSIZE)
+    return jls, pp, sk_0, users
+
+
+@pytest.mark.benchmark(group="joye-libert")
+def test_jls_protect(benchmark):
+    jls, pp, _, users = _jls_setup()
+    x_u_tau = [getrandbits(INPUTSIZE) for _ in range(DIMENSION)]
+    benchmark(jls.protect, pp, users[0], 0, x_u_tau)
+
+
+@pytest.mark.benchmark(group="joye-libert")
+def test_jls_agg(benchmark):
+    jls, pp, sk_0, users = _jls_setup()
+    x_u_tau = [getrandbits(INPUTSIZE) for _ in range(DIMENSION)]
+    list_y_u_tau = [jls.protect(pp, users[u], 0, x_u_tau) for u in users]
+    benchmark(jls.agg, pp, sk_0, 0, list_y_u_tau)
+
+
+@pytest.mark.benchmark(group="secret-sharing")
+def test_sss_share(benchmark):
+    ss = SSS(256)
+    secret = getrandbits(256)
+    benchmark(ss.share, secret, THRESHOLD, NUSERS)
+
+
+@pytest.mark.benchmark(group="secret-sharing")
+def test_sss_reconstruct(benchmark):
+    ss = SSS(256)
+    shares = ss.share(getrandbits(256), THRESHOLD, NUSERS)[:THRESHOLD]
+    lagcoefs = ss.lagrange(shares)
+    benchmark(ss.reconstruct, shares, THRESHOLD, lagcoefs)
+
+
+@pytest.mark.benchmark(group="prg")
+def test_prg_eval_vector(benchmark):
+    prg = PRG(DIMENSION, INPUTSIZE)
+    seed = getrandbits(PRG.security)
+    benchmark(prg.eval_vector, seed)
@@ -0,0 +1,4 @@
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: tests that run 2048-bit key generation"
+    )
@@ -56,30 +56,26 @@ def test_protocol(ndecryptors, nclients, dropout_rate):
     )
 
     clients: Dict[int, EagleClient] = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx] = EagleClient(idx)
 
     server = EagleServer()
 
     all_pkc = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, pkc = clients[idx].setup_register()
         all_pkc[user] = pkc
 
     all_pkc = server.setup_register(all_pkc)
 
     all_e_shares = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, eshares = clients[idx].setup_keysetup(all_pkc)
         all_e_shares[user] = eshares
 
     all_e_shares = server.setup_keysetup(all_e_shares)
 
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         if ndecryptors != -1 and idx <= ndecryptors:
             clients[idx].setup_keysetup2(all_e_shares[idx])
         if ndecryptors == -1:
@@ -87,8 +83,7 @@ def test_protocol(ndecryptors, nclients, dropout_rate):
 
     all_y_key = {}
     all_y = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx].new_fl_step()
         user, y_key, y = clients[idx].online_encrypt()
         all_y_key[user] = y_key
@@ -103,8 +98,7 @@ def test_protocol(ndecryptors, nclients, dropout_rate):
         all_y_key, all_y
     )  # server.online_encrypt(all_y_key, all_y)
     nclients_on = len(clients_on)
-    for i in range(nclients_on):
-        idx = i + 1
+    for idx in range(1, nclients_on + 1):
         if ndecryptors != -1 and idx <= ndecryptors:
             user, shares = clients[idx].online_construct(clients_on)
             all_shares[user] = shares
@@ -115,7 +109,7 @@ def test_protocol(ndecryptors, nclients, dropout_rate):
 
     sum_clear = clients[1].x
 
-    for i in range(1, nclients - dropout):
-        sum_clear = list(map(add, sum_clear, clients[i + 1].x))
+    for idx in range(2, nclients - dropout + 1):
+        sum_clear = list(map(add, sum_clear, clients[idx].x))
 
     assert sum_protocol == sum_clear
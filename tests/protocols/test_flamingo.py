@@ -40,8 +40,7 @@ def test_protocol(ndecryptors, nclients, dropout_rate):
     server = FlamingoServer()
     clients = {}
     pub_key, key_shares = server.setup()
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         if idx <= ndecryptors:
             clients[idx] = FlamingoClient(idx, key_shares[idx - 1], pub_key)
         else:
@@ -49,29 +48,25 @@ def test_protocol(ndecryptors, nclients, dropout_rate):
     server.new_fl_step()
     all_pks = {}
     all_pkc = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx].new_fl_step()
-        user, pks, pkc = clients[i + 1].advertise_keys()
+        user, pks, pkc = clients[idx].advertise_keys()
         all_pks[user] = pks
         all_pkc[user] = pkc
     all_pks, all_pkc = server.advertise_keys(all_pks, all_pkc)
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx].report_pairwise_secrets(all_pks, all_pkc)
     all_e_shares = {}
     all_e_messages = {}
 
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, e_shares, e_messages = clients[idx].report_share_keys()
         all_e_shares[user] = e_shares
         all_e_messages[user] = e_messages
     server.report_share_keys(all_e_shares, all_e_messages)
     all_y = {}
 
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, y = clients[idx].report_masked_input()
         all_y[user] = y
     nclients_on = nclients - dropout
@@ -80,8 +75,7 @@ def test_protocol(ndecryptors, nclients, dropout_rate):
     all_e_shares, all_e_messages = server.cross_check(all_y)
     all_b_shares = {}
     all_sk_shares = {}
-    for i in range(nclients_on):
-        idx = i + 1
+    for idx in range(1, nclients_on + 1):
         if idx <= ndecryptors:
             user, sk_shares, b_shares = clients[idx].reconstruction(
                 all_e_shares[idx], all_e_messages
@@ -1,21 +1,28 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from math import ceil
-from operator import add
 
+import numpy as np
 import pytest
 
 from src.buildingblocks import TJLS
 from src.protocols import ClientFTSA, ServerFTSA
 
+pytestmark = pytest.mark.slow
 
-@pytest.mark.parametrize("nclients, dropout_rate", [(32, 0.0), (32, 0.1), (32, 0.3)])
-def test_protocol(nclients, dropout_rate):
-    dimension = 1000
-    inputsize = 16
-    keysize = 2048
-    dropout = ceil(nclients * dropout_rate)
-    threshold = ceil(2 * nclients / 3)
-    publicparam, _, _ = TJLS(threshold, nclients).setup(keysize)
 
+@lru_cache(maxsize=None)
+def _tjls_setup(threshold, nclients, keysize):
+    # threshold key generation draws two safe primes; share one setup
+    # across the parametrized dropout rates
+    return TJLS(threshold, nclients).setup(keysize)
+
+
+@lru_cache(maxsize=None)
+def _set_scenario(dimension, inputsize, keysize, threshold, nclients):
+    # class-level state only depends on these scalars, so identical cases
+    # skip the repeated configuration
+    publicparam, _, _ = _tjls_setup(threshold, nclients, keysize)
     ClientFTSA.set_scenario(
         dimension, inputsize, keysize, threshold, nclients, publicparam
     )
@@ -23,17 +30,29 @@ def test_protocol(nclients, dropout_rate):
         dimension, inputsize, keysize, threshold, nclients, publicparam
     )
 
-    clients = {}
-    for i in range(nclients):
-        idx = i + 1
-        clients[idx] = ClientFTSA(idx)
+
+@pytest.mark.parametrize(
+    "nclients, dropout_rate",
+    [(32, 0.0), (32, 0.1), (32, 0.3)],
+    ids=["baseline", "10pct", "30pct"],
+)
+def test_protocol(nclients, dropout_rate):
+    dimension = 1000
+    inputsize = 16
+    keysize = 2048
+    dropout = ceil(nclients * dropout_rate)
+    nclients_on = nclients - dropout
+    threshold = ceil(2 * nclients / 3)
+    _set_scenario(dimension, inputsize, keysize, threshold, nclients)
+
+    # position 0 is padding so the 1-based client ids index directly
+    clients = [None] + [ClientFTSA(idx) for idx in range(1, nclients + 1)]
 
     server = ServerFTSA()
 
     all_pks = {}
     all_pkc = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, pks, pkc = clients[idx].setup_register()
         all_pks[user] = pks
         all_pkc[user] = pkc
@@ -41,34 +60,34 @@ def test_protocol(nclients, dropout_rate):
     all_pks, all_pkc = server.setup_register(all_pks, all_pkc)
 
     all_ek_shares = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, eshares = clients[idx].setup_keysetup(all_pks, all_pkc)
         all_ek_shares[user] = eshares
 
     all_ek_shares = server.setup_keysetup(all_ek_shares)
 
-    for i in range(nclients):
-        idx = i + 1
-        clients[idx].setup_keysetup2(all_ek_shares[i + 1])
+    for idx in range(1, nclients + 1):
+        clients[idx].setup_keysetup2(all_ek_shares[idx])
 
+    def encrypt(idx):
+        clients[idx].new_fl_step()
+        return clients[idx].online_encrypt()
+
+    # each client encrypts independently; the gmpy2 modexps release the GIL
     all_eb_shares = {}
     all_y = {}
-    for i in range(nclients - dropout):
-        idx = i + 1
-        clients[idx].new_fl_step()
-        user, eshares, y = clients[idx].online_encrypt()
-        all_eb_shares[user] = eshares
-        all_y[user] = y
+    with ThreadPoolExecutor() as pool:
+        for user, eshares, y in pool.map(encrypt, range(1, nclients_on + 1)):
+            all_eb_shares[user] = eshares
+            all_y[user] = y
 
     all_eb_shares = server.online_encrypt(all_eb_shares, all_y)
-    nclients_on = nclients - ceil(nclients * dropout_rate)
     all_y = {idx: y for idx, y in all_y.items() if idx <= nclients_on}
     all_b_shares = {}
     y_zero_shares = {}
-    for i in range(nclients - dropout):
-        user, bshares, y_zero_share = clients[i + 1].online_construct(
-            all_eb_shares[i + 1]
+    for idx in range(1, nclients_on + 1):
+        user, bshares, y_zero_share = clients[idx].online_construct(
+            all_eb_shares[idx]
         )
 
         all_b_shares[user] = bshares
@@ -76,9 +95,11 @@ def test_protocol(nclients, dropout_rate):
 
     sum_protocol = server.online_construct(all_b_shares, y_zero_shares.values())
 
-    sum_clear = clients[1].x
-
-    for i in range(1, nclients - dropout):
-        sum_clear = list(map(add, sum_clear, clients[i + 1].x))
+    xs = np.asarray(
+        [clients[idx].x for idx in range(1, nclients_on + 1)], dtype=np.int64
+    )
+    sum_clear = xs.sum(axis=0)
 
-    assert sum_protocol == sum_clear
+    # the sums fit int64 (inputsize + log2(nclients) bits), so the whole
+    # vector compares in one shot
+    assert np.array_equal(np.asarray(sum_protocol, dtype=np.int64), sum_clear)
@@ -1,70 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from math import ceil
-from typing import Dict
+from typing import List
 
+import numpy as np
 import pytest
 
 from src.buildingblocks import JLS
 from src.protocols import OwlClient, OwlServer
 
+pytestmark = pytest.mark.slow
 
-@pytest.mark.parametrize("nclients, dropout_rate", [(32, 0.0), (32, 0.1), (32, 0.3)])
+
+@lru_cache(maxsize=None)
+def _jls_setup(nclients, keysize):
+    # key generation draws two primes; share one setup across the
+    # parametrized dropout rates
+    return JLS(nclients).setup(keysize)
+
+
+@lru_cache(maxsize=None)
+def _set_scenario(dimension, inputsize, keysize, threshold, nclients):
+    # class-level state only depends on these scalars, so identical cases
+    # skip the repeated configuration
+    pp, _, _ = _jls_setup(nclients, keysize)
+    OwlClient.set_scenario(dimension, inputsize, keysize, threshold, nclients, pp)
+    OwlServer.set_scenario(dimension, inputsize, keysize, threshold, nclients, pp)
+
+
+@pytest.mark.parametrize(
+    "nclients, dropout_rate",
+    [(32, 0.0), (32, 0.1), (32, 0.3)],
+    ids=["baseline", "10pct", "30pct"],
+)
 def test_protocol(nclients, dropout_rate):
     dimension = 1000
     threshold = 7
     inputsize = 16
     keysize = 2048
     nclients = 10
-    pp, _, _ = JLS(nclients).setup(keysize)
     dropout = ceil(nclients * dropout_rate)
-    OwlClient.set_scenario(dimension, inputsize, keysize, threshold, nclients, pp)
-    OwlServer.set_scenario(dimension, inputsize, keysize, threshold, nclients, pp)
+    _set_scenario(dimension, inputsize, keysize, threshold, nclients)
 
-    clients: Dict[int, OwlClient] = {}
-    for i in range(nclients):
-        idx = i + 1
-        clients[idx] = OwlClient(idx)
+    # position 0 is padding so the 1-based client ids index directly
+    clients: List[OwlClient] = [None] + [
+        OwlClient(idx) for idx in range(1, nclients + 1)
+    ]
 
     server = OwlServer()
 
     allpkc = {}
-    for i in range(nclients):
-        user, pkc = clients[i + 1].setup_register()
+    for idx in range(1, nclients + 1):
+        user, pkc = clients[idx].setup_register()
         allpkc[user] = pkc
     allpkc = server.setup_register(allpkc)
 
-    for i in range(nclients):
-        clients[i + 1].setup_keysetup(allpkc)
+    for idx in range(1, nclients + 1):
+        clients[idx].setup_keysetup(allpkc)
     eshares = {}
-    for i in range(nclients):
-        user, eshare = clients[i + 1].online_key_generation()
+    for idx in range(1, nclients + 1):
+        user, eshare = clients[idx].online_key_generation()
         eshares[user] = eshare
 
     eshares = server.online_key_generation(eshares)
 
-    for i in range(nclients):
-        clients[i + 1].online_key_generation2(eshares[i + 1])
-    all_y = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
+        clients[idx].online_key_generation2(eshares[idx])
+    def encrypt(idx):
         clients[idx].new_fl_step()
-        user, y = clients[idx].online_encrypt()
-        all_y[user] = y
+        return clients[idx].online_encrypt()
+
+    # each client encrypts independently; the gmpy2 modexps release the GIL
+    with ThreadPoolExecutor() as pool:
+        all_y = dict(pool.map(encrypt, range(1, nclients + 1)))
     nclients_on = int(nclients - dropout)
     all_y = {idx: y for idx, y in all_y.items() if idx <= nclients_on}
     clients_on = server.online_encrypt(all_y)
     all_shares = {}
-    for i in range(nclients_on):
-        idx = i + 1
+    for idx in range(1, nclients_on + 1):
         user, shares = clients[idx].online_construct(clients_on)
 
         all_shares[user] = shares
 
     sum_protocol = server.online_construct(all_shares)
 
-    sum_clear = clients[1].x
-    from operator import add
-
-    for i in range(1, nclients - dropout):
-        sum_clear = list(map(add, sum_clear, clients[i + 1].x))
+    xs = np.asarray(
+        [clients[idx].x for idx in range(1, nclients - dropout + 1)], dtype=np.int64
+    )
+    sum_clear = xs.sum(axis=0)
 
-    assert sum_protocol == sum_clear
+    # the sums fit int64 (inputsize + log2(nclients) bits), so the whole
+    # vector compares in one shot
+    assert np.array_equal(np.asarray(sum_protocol, dtype=np.int64), sum_clear)
@@ -1,58 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from math import ceil
-from operator import add
 
+import numpy as np
 import pytest
 
 from src.protocols import SecAggClient, SecAggServer
 
 
-@pytest.mark.parametrize("nclients, dropout_rate", [(32, 0.0), (32, 0.1), (32, 0.3)])
+@lru_cache(maxsize=None)
+def _set_scenario(dimension, inputsize, keysize, threshold, nclients):
+    # class-level state only depends on these scalars, so identical cases
+    # skip the repeated configuration
+    SecAggClient.set_scenario(dimension, inputsize, keysize, threshold, nclients)
+    SecAggServer.set_scenario(dimension, inputsize, keysize, threshold, nclients)
+
+
+@pytest.mark.parametrize(
+    "nclients, dropout_rate",
+    [(32, 0.0), (32, 0.1), (32, 0.3)],
+    ids=["baseline", "10pct", "30pct"],
+)
 def test_protocol(nclients, dropout_rate):
     dimension = 100
     inputsize = 16
     keysize = 256
     dropout = ceil(nclients * dropout_rate)
+    nclients_on = nclients - dropout
     threshold = ceil(2 * nclients / 3)
 
-    SecAggClient.set_scenario(dimension, inputsize, keysize, threshold, nclients)
-    SecAggServer.set_scenario(dimension, inputsize, keysize, threshold, nclients)
-    clients = {}
-    for i in range(nclients):
-        idx = i + 1
-        clients[idx] = SecAggClient(idx)
+    _set_scenario(dimension, inputsize, keysize, threshold, nclients)
+    # position 0 is padding so the 1-based client ids index directly
+    clients = [None] + [SecAggClient(idx) for idx in range(1, nclients + 1)]
 
     server = SecAggServer()
     all_pks = {}
     all_pkc = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx].new_fl_step()
-        user, pks, pkc = clients[i + 1].advertise_keys()
+        user, pks, pkc = clients[idx].advertise_keys()
         all_pks[user] = pks
         all_pkc[user] = pkc
     all_pks, all_pkc = server.advertise_keys(all_pks, all_pkc)
     all_e_shares = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, e_shares = clients[idx].share_keys(all_pks, all_pkc)
         all_e_shares[user] = e_shares
     all_e_shares = server.share_keys(all_e_shares)
-    all_y = {}
-    for i in range(nclients):
-        idx = i + 1
-        user, y = clients[idx].masked_input_collection(all_e_shares[idx])
-        all_y[user] = y
-    nclients_on = nclients - dropout
+    def mask_input(idx):
+        return clients[idx].masked_input_collection(all_e_shares[idx])
+
+    # each client masks independently; the AES keystream expansion
+    # releases the GIL
+    with ThreadPoolExecutor() as pool:
+        all_y = dict(pool.map(mask_input, range(1, nclients + 1)))
     all_y = {idx: y for idx, y in all_y.items() if idx <= nclients_on}
     clients_on = server.masked_input_collection(all_y)
     all_b_shares = {}
     all_sk_shares = {}
-    for i in range(nclients_on):
-        user, sk_shares, b_shares = clients[i + 1].unmasking(clients_on)
+    for idx in range(1, nclients_on + 1):
+        user, sk_shares, b_shares = clients[idx].unmasking(clients_on)
         all_b_shares[user] = b_shares
         all_sk_shares[user] = sk_shares
     sum_protocol = server.unmasking(all_sk_shares, all_b_shares)
-    sum_clear = [1] * dimension
-    for i in range(1, nclients_on):
-        sum_clear = list(map(add, sum_clear, [1] * dimension))
-    assert sum_protocol == sum_clear
+    # every surviving client contributes the all-ones vector
+    sum_clear = np.full(dimension, nclients_on, dtype=np.int64)
+    assert np.array_equal(np.asarray(sum_protocol, dtype=np.int64), sum_clear)
@@ -33,27 +33,23 @@ def test_protocol():
         ndecryptors,
     )
     clients = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx] = FlamingoClient(idx, 0, 0)
     server = FlamingoServer()
     all_pks = {}
     all_pkc = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx].new_fl_step()
-        user, pks, pkc = clients[i + 1].advertise_keys()
+        user, pks, pkc = clients[idx].advertise_keys()
         all_pks[user] = pks
         all_pkc[user] = pkc
     all_pks, all_pkc = server.advertise_keys(all_pks, all_pkc)
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx].report_pairwise_secrets(all_pks, all_pkc)
     all_shares_a = {}
     all_shares_b = {}
     all_commitments = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         user, shares_a, shares_b, commitments = clients[
             idx
         ].setup_send_shares_commits_sk()
@@ -64,8 +60,7 @@ def test_protocol():
         all_shares_a, all_shares_b, all_commitments
     )
     all_complaints = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         complaints = clients[idx].setup_receive_shares_commits_sk(
             all_shares_a[idx], all_shares_b[idx], all_commitments
         )
@@ -73,8 +68,7 @@ def test_protocol():
     all_complaints = server.setup_accept_or_complain_sk(all_complaints)
     all_bcast_shares_a = {}
     all_bcast_shares_b = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         bcast_shares_a, bcast_shares_b = clients[idx].setup_accept_or_complain_sk(
             all_complaints
         )
@@ -84,28 +78,22 @@ def test_protocol():
         all_bcast_shares_a, all_bcast_shares_b
     )
     all_qual = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         qual = clients[idx].setup_forward_shares(all_bcast_shares_a, all_bcast_shares_b)
         all_qual[idx] = qual
     all_qual = server.setup_broadcast_qual(all_qual)
-    shares_a = []
-    for i in range(nclients):
-        idx = i + 1
-        share = clients[idx].setup_create_sk(all_qual)
-        field = FlamingoClient.teg.ss.Field
-        shares_a.append(Share(idx, field(share)))
+    Field = FlamingoClient.teg.ss.Field
+    shares_a = [None] * nclients
+    for idx in range(1, nclients + 1):
+        shares_a[idx - 1] = Share(idx, Field(clients[idx].setup_create_sk(all_qual)))
     all_commitments = {}
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         commitments = clients[idx].setup_send_commits_pk()
         all_commitments[idx] = commitments
     all_commitments = server.setup_send_commits_pk(all_commitments)
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         clients[idx].setup_receive_commits_pk(all_commitments)
-    for i in range(nclients):
-        idx = i + 1
+    for idx in range(1, nclients + 1):
         pk = clients[idx].setup_create_pk()
 
     lag_coeffs = FlamingoClient.teg.ss.lagrange(shares_a)
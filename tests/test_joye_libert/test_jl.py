@@ -1,28 +1,37 @@
 from math import log2
-from random import randint
+from random import getrandbits
 
 import pytest
 
 from src.buildingblocks import JLS, VES, EncryptedNumberJL, PublicParamJL, ServerKeyJL
 
+pytestmark = pytest.mark.slow
+
+
+@pytest.fixture(scope="class")
+def jls_instance() -> JLS:
+    nusers = 100  # You can adjust the number of users as needed
+    return JLS(nusers)
+
+
+@pytest.fixture(scope="class")
+def jls_setup(jls_instance):
+    # key generation dominates the module's wall clock; run it once
+    # for the whole class instead of once per test
+    lmbda = 2048  # You can adjust the key size as needed
+    return jls_instance.setup(lmbda)
 
-class TestJLS:
-    @pytest.fixture
-    def jls_instance(self) -> JLS:
-        nusers = 100  # You can adjust the number of users as needed
-        return JLS(nusers)
 
-    def test_setup(self, jls_instance):
-        lmbda = 2048  # You can adjust the key size as needed
-        public_param, server_key, user_keys = jls_instance.setup(lmbda)
+class TestJLS:
+    def test_setup(self, jls_instance, jls_setup):
+        public_param, server_key, user_keys = jls_setup
         assert isinstance(public_param, PublicParamJL)
         assert isinstance(server_key, ServerKeyJL)
         assert isinstance(user_keys, dict)
         assert len(user_keys) == jls_instance.nusers
 
-    def test_protect(self, jls_instance):
-        lmbda = 2048
-        public_param, server_key, user_keys = jls_instance.setup(lmbda)
+    def test_protect(self, jls_instance, jls_setup):
+        public_param, server_key, user_keys = jls_setup
         user_key = user_keys[0]  # Choose a user for testing
 
         tau = 1  # You can adjust the tau value as needed
@@ -31,13 +40,15 @@ class TestJLS:
 
         assert isinstance(encrypted_x, EncryptedNumberJL)
 
-    def test_agg(self, jls_instance):
+    def test_agg(self, jls_instance, jls_setup):
         lmbda = 2048
-        public_param, server_key, user_keys = jls_instance.setup(lmbda)
+        public_param, server_key, user_keys = jls_setup
         tau = 1  # You can adjust the tau value as needed
-        x_u_tau = randint(0, 2 ** (lmbda // 2 - log2(jls_instance.nusers) - 1))
-        print(x_u_tau.bit_length())
-        print((x_u_tau * jls_instance.nusers).bit_length())
+        # draw exactly nbits bits: getrandbits skips randint's rejection
+        # sampling, and the bound 2**nbits - 1 still leaves room for the
+        # nusers-fold sum below
+        nbits = lmbda // 2 - int(log2(jls_instance.nusers)) - 1
+        x_u_tau = getrandbits(nbits)
         list_y_u_tau = [
             jls_instance.protect(public_param, user_key, tau, x_u_tau)
             for user_key in user_keys.values()
@@ -66,6 +77,3 @@ class TestVES:
 
 if __name__ == "__main__":
     pytest.main()
-
-if __name__ == "__main__":
-    pytest.main()
@@ -1,11 +1,12 @@
-import random
-from collections import defaultdict
-from operator import add
-
+import numpy as np
 import pytest
 
 from src.buildingblocks import TD_TJLS, VES
 
+pytestmark = pytest.mark.slow
+
+rng = np.random.default_rng(0)
+
 
 @pytest.mark.parametrize("threshold, nusers, drops", [(3, 5, 0), (3, 5, 1), (3, 5, 2)])
 def test_scheme(threshold, nusers, drops):
@@ -25,27 +26,23 @@ def test_scheme(threshold, nusers, drops):
     for u in users:
         shares[u] = td_tjl_instance.sk_share(users_key[u - 1])
 
-    users_shares = defaultdict(dict)
+    # row v-1 holds user v's shares; column u-1 is what user u receives
+    shares_mat = np.empty((nusers, nusers), dtype=object)
     for v in users:
-        for u in users:
-            users_shares[u][v] = shares[v][u - 1]
-    xs = []
-    for _ in range(nusers):
-        x = []
-        for _ in range(dimension):
-            x.append(random.randint(0, 1000))
-        xs.append(x)
+        shares_mat[v - 1] = shares[v]
+    xs_np = rng.integers(0, 1001, size=(nusers, dimension), dtype=np.int64)
+    # protect expects plain Python ints
+    xs = xs_np.tolist()
     # encrypt all vectors
     ys = []
     for u in alive:
         y = td_tjl_instance.protect(pp, users_key[u - 1], tau, xs[u - 1])
         ys.append(y)
     if dropped != []:
+        dropped_idx = np.asarray(dropped) - 1
         yzero_shares = {}
         for u in alive:
-            dropped_users_shares = []
-            for v in dropped:
-                dropped_users_shares.append(users_shares[u][v])
+            dropped_users_shares = shares_mat[dropped_idx, u - 1].tolist()
             yzero_shares[u] = td_tjl_instance.share_protect(
                 pp, dropped_users_shares, tau
             )
@@ -59,9 +56,7 @@ def test_scheme(threshold, nusers, drops):
         yzero = None
     sum_protocol = td_tjl_instance.agg(pp, server_key, tau, ys, yzero)
 
-    sum_clear = xs[0]
-    for x in xs[1 : nusers - drops]:
-        sum_clear = list(map(add, sum_clear, x))
+    sum_clear = xs_np[: nusers - drops].sum(axis=0).tolist()
     assert sum_clear == sum_protocol
 
 
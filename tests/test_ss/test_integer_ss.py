@@ -28,10 +28,13 @@ class TestIShare:
 
 
 class TestISSS:
+    nusers = 5
+    delta = factorial(nusers)
+
     def test_share_and_reconstruct(self):
         secret = 42
         threshold = 3
-        nusers = 5
+        nusers = self.nusers
         bitlength = 64
         sigma = 10
 
@@ -45,7 +48,7 @@ class TestISSS:
 
         # Reconstruct the secret using a subset of shares
         selected_shares = shares[:threshold]
-        delta = factorial(nusers)
+        delta = self.delta
         lag_coeffs = iss.lagrange(selected_shares, delta)
         reconstructed_secret = iss.reconstruct(
             selected_shares, threshold, delta, lag_coeffs
@@ -59,7 +62,7 @@ class TestISSS:
 
         secret = 42
         threshold = 3
-        nusers = 5
+        nusers = self.nusers
         bitlength = 64
         sigma = 10
 
@@ -73,7 +76,7 @@ class TestISSS:
 
         # Reconstruct the secret using less than the threshold
         selected_shares = shares[: threshold - 1]
-        delta = factorial(nusers)
+        delta = self.delta
         with pytest.raises(AssertionError):
             lag_coeffs = iss.lagrange(selected_shares, delta)
             _ = iss.reconstruct(selected_shares, threshold, delta, lag_coeffs)